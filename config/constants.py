@@ -24,6 +24,9 @@ class GamePhase(Enum):
 # Game phase thresholds
 ENDGAME_PIECE_THRESHOLD = 12
 
+# Random candidates fetched per query when filtering out solved puzzles
+SOLVED_FILTER_SAMPLE_SIZE = 32
+
 # Endgame theme keywords for filtering
 ENDGAME_THEMES = [
     'endgame', 'mateIn1', 'mateIn2', 'mateIn3', 'mateIn4', 'mateIn5',
@@ -37,7 +37,8 @@ class MoveValidator:
         Returns:
             chess.Board ready for player's move
         """
-        board = chess.Board(self.puzzle.fen)
+        # Copy the puzzle's cached board rather than re-parsing the FEN
+        board = self.puzzle.board.copy(stack=False)
 
         # Apply opponent's first move (creates the tactical opportunity)
         first_move = chess.Move.from_uci(self.puzzle.moves[0])
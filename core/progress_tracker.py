@@ -3,9 +3,10 @@ Progress tracking and statistics
 """
 
 import json
+import sys
 from pathlib import Path
 from datetime import datetime
-from typing import List, Set
+from typing import Dict, List, Set, Tuple
 from data.models import ProgressEntry, UserProgress
 
 
@@ -24,6 +25,15 @@ class ProgressTracker:
         """
         self.storage_path = Path(storage_path)
         self.entries: List[ProgressEntry] = []
+
+        # Cached aggregates, rebuilt on load and updated per recorded attempt
+        self._solved_ids: Set[str] = set()
+        self._attempted_by_diff: Dict[int, int] = {}
+        self._solved_by_diff: Dict[int, int] = {}
+        self._solved_time_by_diff: Dict[int, float] = {}
+        self._current_streak = 0
+        self._best_streak = 0
+
         self.load()
 
     def load(self):
@@ -44,6 +54,8 @@ class ProgressTracker:
             self.entries = []
             self.save()
 
+        self._recompute()
+
     def save(self):
         """Persist progress to JSON file"""
         # Ensure directory exists
@@ -86,8 +98,44 @@ class ProgressTracker:
             hints_used=hints_used
         )
         self.entries.append(entry)
+        self._accumulate(entry)
+
+        if solved:
+            self._current_streak += 1
+            self._best_streak = max(self._best_streak, self._current_streak)
+        else:
+            self._current_streak = 0
+
         self.save()
 
+    def _recompute(self):
+        """Rebuild cached aggregates from the full entry list"""
+        self._solved_ids = set()
+        self._attempted_by_diff = {}
+        self._solved_by_diff = {}
+        self._solved_time_by_diff = {}
+
+        for entry in self.entries:
+            self._accumulate(entry)
+
+        self._current_streak, self._best_streak = self._calculate_streaks()
+
+    def _accumulate(self, entry: ProgressEntry):
+        """
+        Fold a single entry into the cached counters
+
+        Args:
+            entry: Progress entry to add
+        """
+        diff = entry.difficulty
+        self._attempted_by_diff[diff] = self._attempted_by_diff.get(diff, 0) + 1
+
+        if entry.solved:
+            # Interned so repeated IDs share storage and compare by identity
+            self._solved_ids.add(sys.intern(entry.puzzle_id))
+            self._solved_by_diff[diff] = self._solved_by_diff.get(diff, 0) + 1
+            self._solved_time_by_diff[diff] = self._solved_time_by_diff.get(diff, 0.0) + entry.time_taken
+
     def get_statistics(self) -> UserProgress:
         """
         Calculate comprehensive statistics
@@ -95,75 +143,52 @@ class ProgressTracker:
         Returns:
             UserProgress object with all statistics
         """
-        solved_entries = [e for e in self.entries if e.solved]
-
-        total_solved = len(solved_entries)
+        total_solved = sum(self._solved_by_diff.values())
         total_attempts = len(self.entries)
         success_rate = (total_solved / total_attempts * 100) if total_attempts > 0 else 0.0
 
-        # Calculate streaks
-        current_streak = self._calculate_current_streak()
-        best_streak = self._calculate_best_streak()
-
         # Breakdown by difficulty
-        solved_by_diff = {i: 0 for i in range(1, 6)}
-        for entry in solved_entries:
-            if entry.difficulty in solved_by_diff:
-                solved_by_diff[entry.difficulty] += 1
-
-        # Get unique solved puzzle IDs
-        solved_puzzles = {e.puzzle_id for e in solved_entries}
+        solved_by_diff = {i: self._solved_by_diff.get(i, 0) for i in range(1, 6)}
 
         return UserProgress(
             total_solved=total_solved,
             total_attempts=total_attempts,
             success_rate=success_rate,
-            current_streak=current_streak,
-            best_streak=best_streak,
+            current_streak=self._current_streak,
+            best_streak=self._best_streak,
             solved_by_difficulty=solved_by_diff,
-            solved_puzzles=solved_puzzles
+            solved_puzzles=set(self._solved_ids)
         )
 
-    def _calculate_current_streak(self) -> int:
-        """
-        Count consecutive solved puzzles from most recent
-
-        Returns:
-            Current streak count
-        """
-        streak = 0
-        for entry in reversed(self.entries):
-            if entry.solved:
-                streak += 1
-            else:
-                break
-        return streak
-
-    def _calculate_best_streak(self) -> int:
+    def _calculate_streaks(self) -> Tuple[int, int]:
         """
-        Find longest streak in history
+        Compute current and best streak in a single pass over history
 
         Returns:
-            Best streak count
+            Tuple of (current_streak, best_streak)
         """
         current = 0
         best = 0
         for entry in self.entries:
             if entry.solved:
                 current += 1
-                best = max(best, current)
+                if current > best:
+                    best = current
             else:
                 current = 0
-        return best
+        return current, best
 
     def get_solved_puzzle_ids(self) -> Set[str]:
         """
         Get set of solved puzzle IDs
 
+        The set is maintained incrementally and returned directly,
+        so callers must treat it as read-only.
+
         Returns:
             Set of puzzle IDs that have been solved
         """
-        return {e.puzzle_id for e in self.entries if e.solved}
+        return self._solved_ids
 
     def has_attempted_puzzle(self, puzzle_id: str) -> bool:
         """
@@ -187,7 +212,7 @@ class ProgressTracker:
         Returns:
             True if solved before
         """
-        return any(e.puzzle_id == puzzle_id and e.solved for e in self.entries)
+        return puzzle_id in self._solved_ids
 
     def get_average_time(self, difficulty: int = None) -> float:
         """
@@ -199,16 +224,17 @@ class ProgressTracker:
         Returns:
             Average time in seconds
         """
-        entries = [e for e in self.entries if e.solved]
-
         if difficulty:
-            entries = [e for e in entries if e.difficulty == difficulty]
+            count = self._solved_by_diff.get(difficulty, 0)
+            total_time = self._solved_time_by_diff.get(difficulty, 0.0)
+        else:
+            count = sum(self._solved_by_diff.values())
+            total_time = sum(self._solved_time_by_diff.values())
 
-        if not entries:
+        if not count:
             return 0.0
 
-        total_time = sum(e.time_taken for e in entries)
-        return total_time / len(entries)
+        return total_time / count
 
     def get_success_rate_by_difficulty(self, difficulty: int) -> float:
         """
@@ -220,10 +246,10 @@ class ProgressTracker:
         Returns:
             Success rate as percentage
         """
-        attempts = [e for e in self.entries if e.difficulty == difficulty]
+        attempted = self._attempted_by_diff.get(difficulty, 0)
 
-        if not attempts:
+        if not attempted:
             return 0.0
 
-        solved = sum(1 for e in attempts if e.solved)
-        return (solved / len(attempts)) * 100
+        solved = self._solved_by_diff.get(difficulty, 0)
+        return (solved / attempted) * 100
@@ -6,7 +6,9 @@ from typing import Optional, Set
 from data.database import Database
 from data.models import Puzzle
 from config.settings import Settings
-from config.constants import ENDGAME_PIECE_THRESHOLD, ENDGAME_THEMES, OPENING_THEMES
+from config.constants import (
+    ENDGAME_PIECE_THRESHOLD, ENDGAME_THEMES, OPENING_THEMES, SOLVED_FILTER_SAMPLE_SIZE
+)
 from utils.exceptions import PuzzleNotFoundError
 
 
@@ -128,33 +130,71 @@ class PuzzleSelector:
             where_clauses.append("t.theme_name = ?")
             params.append(theme)
 
-        # Exclude solved puzzles
-        if exclude_solved and solved_puzzle_ids:
-            placeholders = ','.join(['?' for _ in solved_puzzle_ids])
-            where_clauses.append(f"p.puzzle_id NOT IN ({placeholders})")
-            params.extend(solved_puzzle_ids)
+        # Solved puzzles are first filtered client-side from a random sample,
+        # avoiding a NOT IN clause with one placeholder per solved puzzle
+        filter_solved = exclude_solved and bool(solved_puzzle_ids)
 
         # Build query
         where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
 
-        query = f"""
+        # Execute query
+        if not filter_solved:
+            row = self.db.execute_one(self._build_query(where_sql), tuple(params) + (1,))
+        else:
+            rows = self.db.execute_query(
+                self._build_query(where_sql), tuple(params) + (SOLVED_FILTER_SAMPLE_SIZE,)
+            )
+            row = next((r for r in rows if r['puzzle_id'] not in solved_puzzle_ids), None)
+
+            # A full sample of solved puzzles says nothing about the rest of
+            # the matches, so exclude the solved IDs exactly
+            if row is None and len(rows) == SOLVED_FILTER_SAMPLE_SIZE:
+                self._load_solved_ids(solved_puzzle_ids)
+                where_sql += " AND p.puzzle_id NOT IN (SELECT puzzle_id FROM temp.solved_puzzles)"
+                row = self.db.execute_one(self._build_query(where_sql), tuple(params) + (1,))
+
+        if not row:
+            return None
+
+        # Convert to Puzzle object
+        return self._row_to_puzzle(row)
+
+    @staticmethod
+    def _build_query(where_sql: str) -> str:
+        """
+        Build the random puzzle query for a WHERE clause
+
+        Args:
+            where_sql: SQL condition (the LIMIT is the last parameter)
+
+        Returns:
+            SQL query string
+        """
+        return f"""
             SELECT DISTINCT p.*
             FROM puzzles p
             LEFT JOIN puzzle_themes pt ON p.puzzle_id = pt.puzzle_id
             LEFT JOIN themes t ON pt.theme_id = t.theme_id
             WHERE {where_sql}
             ORDER BY RANDOM()
-            LIMIT 1
+            LIMIT ?
         """
 
-        # Execute query
-        row = self.db.execute_one(query, tuple(params))
-
-        if not row:
-            return None
+    def _load_solved_ids(self, solved_puzzle_ids: Set[str]):
+        """
+        Fill the connection's temp table of solved puzzle IDs
 
-        # Convert to Puzzle object
-        return self._row_to_puzzle(row)
+        Args:
+            solved_puzzle_ids: Set of solved puzzle IDs
+        """
+        self.db.execute_write(
+            "CREATE TEMP TABLE IF NOT EXISTS solved_puzzles (puzzle_id TEXT PRIMARY KEY)"
+        )
+        self.db.execute_write("DELETE FROM temp.solved_puzzles")
+        self.db.execute_many(
+            "INSERT INTO temp.solved_puzzles VALUES (?)",
+            [(puzzle_id,) for puzzle_id in solved_puzzle_ids]
+        )
 
     def _build_phase_filter(self, game_phase: str) -> tuple[str, list]:
         """
@@ -16,7 +16,8 @@ class Database:
         Initialize database connection
 
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, or a "file:" URI
+                     (e.g. a shared-cache in-memory database)
 
         Raises:
             DatabaseError: If connection fails
@@ -28,7 +29,7 @@ class Database:
     def _connect(self):
         """Establish database connection"""
         try:
-            self.conn = sqlite3.connect(str(self.db_path))
+            self.conn = sqlite3.connect(str(self.db_path), uri=True)
             self.conn.row_factory = sqlite3.Row
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to connect to database: {e}")
@@ -2,13 +2,17 @@
 Data models for chess puzzle generator
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 import chess
 
+# dataclass(slots=True) requires Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class Puzzle:
     """Represents a chess puzzle"""
     puzzle_id: str
@@ -22,6 +26,19 @@ class Puzzle:
     game_url: str
     opening_tags: List[str]
     piece_count: int                   # Calculated on import
+    _board: Optional[chess.Board] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def board(self) -> chess.Board:
+        """
+        Board at the puzzle FEN, parsed on first access and cached
+        Shared between callers - copy it before making moves
+        """
+        board = self._board
+        if board is None:
+            board = chess.Board(self.fen)
+            object.__setattr__(self, '_board', board)
+        return board
 
     @property
     def initial_position_fen(self) -> str:
@@ -29,7 +46,7 @@ class Puzzle:
         FEN after applying first move (position player sees)
         The first move is the opponent's move that creates the tactical opportunity
         """
-        board = chess.Board(self.fen)
+        board = self.board.copy(stack=False)
         first_move = chess.Move.from_uci(self.moves[0])
         board.push(first_move)
         return board.fen()
@@ -48,9 +65,9 @@ class Puzzle:
         return ", ".join(self.themes)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ProgressEntry:
-    """Represents a solved puzzle attempt"""
+    """Represents a solved puzzle attempt (immutable once recorded)"""
     puzzle_id: str
     solved: bool
     attempts: int
@@ -37,6 +37,7 @@ setup(
         "dev": [
             "pytest>=7.4.3",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.5.0",
             "black>=23.12.1",
             "mypy>=1.7.1",
         ]
@@ -0,0 +1,33 @@
+"""
+Tests for common utility functions
+"""
+
+from utils.helpers import truncate_string
+
+
+class TestTruncateString:
+    """Test suite for truncate_string"""
+
+    def test_short_text_unchanged(self):
+        """Test text within the limit is returned as-is"""
+        assert truncate_string("hello", 5) == "hello"
+
+    def test_long_text_truncated_with_suffix(self):
+        """Test long text is cut to fit the suffix"""
+        assert truncate_string("hello world", 8) == "hello..."
+
+    def test_limit_equal_to_suffix_length(self):
+        """Test a limit equal to the suffix length returns only the suffix"""
+        assert truncate_string("hello world", 3) == "..."
+
+    def test_limit_below_suffix_length(self):
+        """Test a limit below the suffix length truncates the suffix itself"""
+        assert truncate_string("hello world", 2) == ".."
+        assert truncate_string("hello world", 0) == ""
+        assert truncate_string("hello world", -2) == ""
+
+    def test_result_never_exceeds_max_length(self):
+        """Test the result fits max_length for every limit (empty if negative)"""
+        text = "hello world"
+        for max_length in range(-3, len(text) + 2):
+            assert len(truncate_string(text, max_length)) <= max(max_length, 0)
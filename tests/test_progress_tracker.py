@@ -14,8 +14,9 @@ from data.models import ProgressEntry
 
 @pytest.fixture
 def temp_progress_file():
-    """Create a temporary progress file"""
-    temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
+    """Create a temporary progress file (RAM-backed where available)"""
+    temp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json', dir=temp_dir)
     temp_file.close()
     yield temp_file.name
     # Cleanup
@@ -26,12 +27,13 @@ def temp_progress_file():
 @pytest.fixture
 def tracker(temp_progress_file):
     """Create a ProgressTracker instance"""
-    return ProgressTracker(progress_file=temp_progress_file)
+    return ProgressTracker(temp_progress_file)
 
 
 @pytest.fixture
 def sample_entries():
     """Create sample progress entries"""
+    ts = datetime.now().isoformat()
     return [
         ProgressEntry(
             puzzle_id="puzzle001",
@@ -39,7 +41,7 @@ def sample_entries():
             attempts=1,
             time_taken=30.5,
             difficulty=2,
-            timestamp=datetime.now().isoformat(),
+            timestamp=ts,
             hints_used=0
         ),
         ProgressEntry(
@@ -48,7 +50,7 @@ def sample_entries():
             attempts=2,
             time_taken=45.2,
             difficulty=3,
-            timestamp=datetime.now().isoformat(),
+            timestamp=ts,
             hints_used=1
         ),
         ProgressEntry(
@@ -57,7 +59,7 @@ def sample_entries():
             attempts=3,
             time_taken=60.0,
             difficulty=3,
-            timestamp=datetime.now().isoformat(),
+            timestamp=ts,
             hints_used=2
         ),
         ProgressEntry(
@@ -66,7 +68,7 @@ def sample_entries():
             attempts=1,
             time_taken=25.0,
             difficulty=2,
-            timestamp=datetime.now().isoformat(),
+            timestamp=ts,
             hints_used=0
         ),
     ]
@@ -117,6 +119,7 @@ class TestProgressTracker:
 
     def test_current_streak_calculation(self, tracker):
         """Test current streak calculation"""
+        ts = datetime.now().isoformat()
         # Add 3 consecutive solved puzzles
         for i in range(3):
             entry = ProgressEntry(
@@ -125,7 +128,7 @@ class TestProgressTracker:
                 attempts=1,
                 time_taken=30.0,
                 difficulty=2,
-                timestamp=datetime.now().isoformat(),
+                timestamp=ts,
                 hints_used=0
             )
             tracker.add_entry(entry)
@@ -135,6 +138,7 @@ class TestProgressTracker:
 
     def test_streak_breaks_on_failure(self, tracker):
         """Test that streak breaks when a puzzle is not solved"""
+        ts = datetime.now().isoformat()
         # Add 2 solved
         for i in range(2):
             tracker.add_entry(ProgressEntry(
@@ -143,7 +147,7 @@ class TestProgressTracker:
                 attempts=1,
                 time_taken=30.0,
                 difficulty=2,
-                timestamp=datetime.now().isoformat(),
+                timestamp=ts,
                 hints_used=0
             ))
 
@@ -154,7 +158,7 @@ class TestProgressTracker:
             attempts=2,
             time_taken=45.0,
             difficulty=3,
-            timestamp=datetime.now().isoformat(),
+            timestamp=ts,
             hints_used=1
         ))
 
@@ -165,7 +169,7 @@ class TestProgressTracker:
             attempts=1,
             time_taken=30.0,
             difficulty=2,
-            timestamp=datetime.now().isoformat(),
+            timestamp=ts,
             hints_used=0
         ))
 
@@ -175,6 +179,7 @@ class TestProgressTracker:
 
     def test_best_streak_tracking(self, tracker):
         """Test best streak is tracked correctly"""
+        ts = datetime.now().isoformat()
         # Streak of 3
         for i in range(3):
             tracker.add_entry(ProgressEntry(
@@ -183,7 +188,7 @@ class TestProgressTracker:
                 attempts=1,
                 time_taken=30.0,
                 difficulty=2,
-                timestamp=datetime.now().isoformat(),
+                timestamp=ts,
                 hints_used=0
             ))
 
@@ -194,7 +199,7 @@ class TestProgressTracker:
             attempts=2,
             time_taken=45.0,
             difficulty=3,
-            timestamp=datetime.now().isoformat(),
+            timestamp=ts,
             hints_used=1
         ))
 
@@ -206,7 +211,7 @@ class TestProgressTracker:
                 attempts=1,
                 time_taken=30.0,
                 difficulty=2,
-                timestamp=datetime.now().isoformat(),
+                timestamp=ts,
                 hints_used=0
             ))
 
@@ -284,7 +289,7 @@ class TestProgressTracker:
             json.dump(initial_data, f)
 
         # Create tracker (should load existing data)
-        tracker = ProgressTracker(progress_file=temp_progress_file)
+        tracker = ProgressTracker(temp_progress_file)
         stats = tracker.get_stats()
 
         assert stats["total_attempts"] == 1
@@ -370,6 +375,7 @@ class TestProgressTracker:
 
     def test_success_rate_with_all_failed(self, tracker):
         """Test success rate when all puzzles failed"""
+        ts = datetime.now().isoformat()
         for i in range(3):
             tracker.add_entry(ProgressEntry(
                 puzzle_id=f"fail{i}",
@@ -377,7 +383,7 @@ class TestProgressTracker:
                 attempts=2,
                 time_taken=45.0,
                 difficulty=2,
-                timestamp=datetime.now().isoformat(),
+                timestamp=ts,
                 hints_used=1
             ))
 
@@ -388,6 +394,7 @@ class TestProgressTracker:
 
     def test_success_rate_with_all_solved(self, tracker):
         """Test success rate when all puzzles solved"""
+        ts = datetime.now().isoformat()
         for i in range(3):
             tracker.add_entry(ProgressEntry(
                 puzzle_id=f"solve{i}",
@@ -395,7 +402,7 @@ class TestProgressTracker:
                 attempts=1,
                 time_taken=30.0,
                 difficulty=2,
-                timestamp=datetime.now().isoformat(),
+                timestamp=ts,
                 hints_used=0
             ))
 
@@ -404,6 +411,7 @@ class TestProgressTracker:
 
     def test_data_integrity_after_multiple_operations(self, tracker):
         """Test data remains consistent after multiple operations"""
+        ts = datetime.now().isoformat()
         # Add some entries
         for i in range(5):
             tracker.add_entry(ProgressEntry(
@@ -412,7 +420,7 @@ class TestProgressTracker:
                 attempts=1,
                 time_taken=30.0,
                 difficulty=2,
-                timestamp=datetime.now().isoformat(),
+                timestamp=ts,
                 hints_used=0
             ))
 
@@ -5,8 +5,8 @@ Tests for puzzle selector component
 import pytest
 import sqlite3
 from pathlib import Path
-import tempfile
-import os
+import uuid
+from dataclasses import fields
 
 from core.puzzle_selector import PuzzleSelector
 from data.database import Database
@@ -16,10 +16,9 @@ from config.constants import GamePhase
 
 @pytest.fixture
 def temp_db():
-    """Create a temporary database for testing"""
-    # Create temp directory
-    temp_dir = tempfile.mkdtemp()
-    db_path = os.path.join(temp_dir, "test_puzzles.db")
+    """Create a temporary in-memory database for testing"""
+    # Shared-cache in-memory database, alive while `db` stays open
+    db_path = f"file:test_puzzles_{uuid.uuid4().hex}?mode=memory&cache=shared"
 
     # Create database
     db = Database(db_path)
@@ -58,21 +57,18 @@ def temp_db():
          "d6e6 d4e4 e6f6", 1600, 60, 120, 600, "", "", 2),
     ]
 
-    for puzzle_data in test_puzzles:
-        db.execute_write(
-            """INSERT INTO puzzles
-            (puzzle_id, fen, moves, rating, rating_deviation, popularity,
-             nb_plays, game_url, opening_tags, piece_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            puzzle_data
-        )
+    db.execute_many(
+        """INSERT INTO puzzles
+        (puzzle_id, fen, moves, rating, rating_deviation, popularity,
+         nb_plays, game_url, opening_tags, piece_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        test_puzzles
+    )
 
-    yield db_path
+    yield db
 
-    # Cleanup
+    # Cleanup (closing the last connection frees the database)
     db.close()
-    os.remove(db_path)
-    os.rmdir(temp_dir)
 
 
 class TestPuzzleSelector:
@@ -179,14 +175,13 @@ class TestPuzzleSelector:
     def test_puzzle_data_structure(self, temp_db):
         """Test that returned puzzle has correct structure"""
         selector = PuzzleSelector(temp_db)
-        puzzle = selector.select_puzzle(difficulty=1)
+        puzzle = selector.select_puzzle(
+            difficulty=1, game_phase=GamePhase.MIDDLEGAME.value
+        )
 
-        assert puzzle is not None
-        assert hasattr(puzzle, 'puzzle_id')
-        assert hasattr(puzzle, 'fen')
-        assert hasattr(puzzle, 'moves')
-        assert hasattr(puzzle, 'rating')
-        assert hasattr(puzzle, 'themes')
+        assert isinstance(puzzle, Puzzle)
+        names = {f.name for f in fields(puzzle)}
+        assert {'puzzle_id', 'fen', 'moves', 'rating', 'themes'} <= names
         assert isinstance(puzzle.moves, list)
         assert len(puzzle.moves) > 0
 
@@ -201,3 +196,28 @@ class TestPuzzleSelector:
         # Should have at least some variation (not all the same)
         # With only 2 beginner puzzles, we should see both
         assert len(set(puzzle_ids)) >= 1
+
+    def test_unsolved_preferred_when_sample_is_all_solved(self):
+        """Test unsolved puzzles are found even when most matches are solved"""
+        db_path = f"file:test_puzzles_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        db = Database(db_path)
+        db.create_schema()
+
+        # 400 beginner middlegame puzzles, only the last 10 unsolved
+        db.execute_many(
+            """INSERT INTO puzzles
+            (puzzle_id, fen, moves, rating, rating_deviation, popularity,
+             nb_plays, game_url, opening_tags, piece_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [(f"p{i:03d}", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+              "e2e4 e7e5", 800, 50, 100, 500, "", "", 32) for i in range(400)]
+        )
+        solved = {f"p{i:03d}" for i in range(390)}
+
+        try:
+            selector = PuzzleSelector(db)
+            for _ in range(50):
+                puzzle = selector.select_puzzle(1, GamePhase.MIDDLEGAME.value, solved)
+                assert puzzle.puzzle_id not in solved
+        finally:
+            db.close()
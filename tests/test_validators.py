@@ -4,16 +4,21 @@ Tests for input validators
 
 import pytest
 
-from utils.validators import InputValidator
+from utils.validators import (
+    InputValidator,
+    validate_difficulty,
+    validate_game_phase,
+    validate_yes_no,
+)
 from utils.exceptions import InvalidDifficultyError, InvalidGamePhaseError
 
 
 class TestInputValidator:
     """Test suite for InputValidator"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def validator(self):
-        """Create an InputValidator instance"""
+        """Create a shared InputValidator instance (stateless)"""
         return InputValidator()
 
     # ===== Difficulty Validation Tests =====
@@ -30,35 +35,11 @@ class TestInputValidator:
             difficulty = validator.validate_difficulty(i)
             assert difficulty == i
 
-    def test_invalid_difficulty_zero(self, validator):
-        """Test difficulty level 0 (invalid)"""
-        with pytest.raises(InvalidDifficultyError):
-            validator.validate_difficulty("0")
-
-    def test_invalid_difficulty_six(self, validator):
-        """Test difficulty level 6 (invalid)"""
-        with pytest.raises(InvalidDifficultyError):
-            validator.validate_difficulty("6")
-
-    def test_invalid_difficulty_negative(self, validator):
-        """Test negative difficulty"""
-        with pytest.raises(InvalidDifficultyError):
-            validator.validate_difficulty("-1")
-
-    def test_invalid_difficulty_non_numeric(self, validator):
-        """Test non-numeric difficulty input"""
-        with pytest.raises(InvalidDifficultyError):
-            validator.validate_difficulty("easy")
-
-    def test_invalid_difficulty_float(self, validator):
-        """Test float difficulty input"""
-        with pytest.raises(InvalidDifficultyError):
-            validator.validate_difficulty("2.5")
-
-    def test_invalid_difficulty_empty(self, validator):
-        """Test empty difficulty string"""
-        with pytest.raises(InvalidDifficultyError):
-            validator.validate_difficulty("")
+    def test_invalid_difficulties(self, validator):
+        """Test out-of-range, non-numeric, float and empty difficulties"""
+        for value in ("0", "6", "-1", "easy", "2.5", ""):
+            with pytest.raises(InvalidDifficultyError):
+                validator.validate_difficulty(value)
 
     # ===== Game Phase Validation Tests =====
 
@@ -99,20 +80,11 @@ class TestInputValidator:
         assert validator.validate_game_phase("MiDdLeGaMe") == "middlegame"
         assert validator.validate_game_phase("END") == "endgame"
 
-    def test_invalid_game_phase(self, validator):
-        """Test invalid game phase"""
-        with pytest.raises(InvalidGamePhaseError):
-            validator.validate_game_phase("invalid")
-
-    def test_invalid_game_phase_empty(self, validator):
-        """Test empty game phase"""
-        with pytest.raises(InvalidGamePhaseError):
-            validator.validate_game_phase("")
-
-    def test_invalid_game_phase_numeric(self, validator):
-        """Test numeric game phase (invalid)"""
-        with pytest.raises(InvalidGamePhaseError):
-            validator.validate_game_phase("123")
+    def test_invalid_game_phases(self, validator):
+        """Test unknown, empty and numeric game phases"""
+        for value in ("invalid", "", "123"):
+            with pytest.raises(InvalidGamePhaseError):
+                validator.validate_game_phase(value)
 
     # ===== Yes/No Validation Tests =====
 
@@ -131,19 +103,10 @@ class TestInputValidator:
         assert validator.validate_yes_no("NO") is False
 
     def test_yes_no_invalid(self, validator):
-        """Test invalid yes/no response"""
-        with pytest.raises(ValueError):
-            validator.validate_yes_no("maybe")
-
-    def test_yes_no_empty(self, validator):
-        """Test empty yes/no response"""
-        with pytest.raises(ValueError):
-            validator.validate_yes_no("")
-
-    def test_yes_no_numeric(self, validator):
-        """Test numeric yes/no response"""
-        with pytest.raises(ValueError):
-            validator.validate_yes_no("1")
+        """Test invalid, empty and numeric yes/no responses"""
+        for value in ("maybe", "", "1"):
+            with pytest.raises(ValueError):
+                validator.validate_yes_no(value)
 
     # ===== Edge Cases and Special Inputs =====
 
@@ -271,3 +234,11 @@ class TestInputValidator:
         """Test yes/no with None input"""
         with pytest.raises((ValueError, AttributeError)):
             validator.validate_yes_no(None)
+
+    # ===== Module-Level Function Tests =====
+
+    def test_module_functions(self):
+        """Test validators are usable as plain module-level functions"""
+        assert validate_difficulty("4") == 4
+        assert validate_game_phase("mid") == "middlegame"
+        assert validate_yes_no("y") is True
@@ -3,14 +3,26 @@ Command-line interface for chess puzzle trainer
 """
 
 import chess
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from core.puzzle_manager import PuzzleManager
-from rendering.board_renderer import BoardRenderer
+from data.models import Puzzle
 from rendering.terminal_image import TerminalImageRenderer
 from ui.display import Display
 from ui.input_handler import InputHandler
 from utils.exceptions import PuzzleNotFoundError
 from config.settings import Settings
 
+if TYPE_CHECKING:
+    from rendering.board_renderer import BoardRenderer
+
+# Side-to-move names indexed by chess.Board.turn (chess.BLACK=False, chess.WHITE=True)
+_TURN_NAME = ("Black", "White")
+
+# Message templates used inside the puzzle loop
+_FMT_TIMER_STATUS = "\n{}".format
+_FMT_TO_MOVE = "\n{} to move".format
+_FMT_BOARD_UPDATED = "Board updated: {}".format
+
 
 class ChessPuzzleCLI:
     """
@@ -26,11 +38,41 @@ class ChessPuzzleCLI:
             manager: PuzzleManager instance
         """
         self.manager = manager
-        self.renderer = BoardRenderer(str(Settings.IMAGES_DIR))
-        self.terminal_image = TerminalImageRenderer()
         self.display = Display()
         self.input_handler = InputHandler()
+
+        # The board renderer is created on first use (see the renderer
+        # property), so menus, statistics and help never load cairo
+        self._renderer: Optional["BoardRenderer"] = None
+
+        # Terminal detection is cheap; resolve the display strategy once
+        self.terminal_image = TerminalImageRenderer()
         self.can_show_inline = self.terminal_image.can_display_images()
+        self._show_board = self._show_inline if self.can_show_inline else self._show_path
+
+        # Hint board images of the current puzzle, keyed by
+        # (puzzle_id, hint level, position FEN)
+        self._hint_images: Dict[Tuple[str, int, str], str] = {}
+
+        # In-puzzle commands; handlers return True when the puzzle should end
+        self._commands = {
+            'quit': self._cmd_quit,
+            'hint': self._cmd_hint,
+        }
+
+    @property
+    def renderer(self) -> "BoardRenderer":
+        """
+        Board renderer, created on first access
+
+        Returns:
+            BoardRenderer instance
+        """
+        if self._renderer is None:
+            from rendering.board_renderer import BoardRenderer
+
+            self._renderer = BoardRenderer(str(Settings.IMAGES_DIR))
+        return self._renderer
 
     def run(self):
         """Main game loop"""
@@ -83,6 +125,8 @@ class ChessPuzzleCLI:
             self.display.pause()
             return
 
+        self._hint_images.clear()
+
         # Display puzzle info
         self.display.show_puzzle_header(puzzle, difficulty, game_phase)
         if theme:
@@ -93,25 +137,31 @@ class ChessPuzzleCLI:
         image_path = self.renderer.render_puzzle(current_board, puzzle.puzzle_id)
 
         # Display board - inline if supported, otherwise show path
-        if self.can_show_inline:
-            self.terminal_image.display_image(image_path, width=400)
-        else:
-            turn = "White" if current_board.turn == chess.WHITE else "Black"
-            self.display.show_board_info(image_path, turn)
+        self._show_board(image_path, current_board)
+
+        # Bind per-iteration lookups once for the solving loop
+        manager = self.manager
+        is_complete = manager.is_puzzle_complete
+        is_time_up = manager.is_time_up
+        get_timer_status = manager.get_timer_status
+        get_board = manager.get_current_board
+        render = self.renderer.render_puzzle
+        show_board = self._show_board
+        commands = self._commands
 
         # Puzzle solving loop
-        while not self.manager.is_puzzle_complete():
+        while not is_complete():
             # Check if time is up
-            if self.manager.is_time_up():
+            if is_time_up():
                 print("\n⏰ Time's up!")
-                self.manager.finish_puzzle()
+                manager.finish_puzzle()
                 self.display.pause()
                 return
 
             # Show timer status if enabled
-            timer_status = self.manager.get_timer_status()
+            timer_status = get_timer_status()
             if timer_status:
-                print(f"\n{timer_status}")
+                print(_FMT_TIMER_STATUS(timer_status))
 
             self.display.show_move_prompt()
             user_input = self.input_handler.get_move_or_command()
@@ -120,55 +170,28 @@ class ChessPuzzleCLI:
                 continue
 
             # Handle commands
-            if user_input == 'quit':
-                # Quit immediately without confirmation
-                self.manager.finish_puzzle(quit_early=True)
-                return
-
-            elif user_input == 'hint':
-                hint = self.manager.get_hint()
-                if hint:
-                    self.display.show_hint(hint)
-
-                    # Re-render board with hint visualization
-                    current_board = self.manager.get_current_board()
-                    image_path = self.renderer.render_puzzle(
-                        current_board,
-                        puzzle.puzzle_id,
-                        hint=hint
-                    )
-
-                    # Display updated board
-                    if self.can_show_inline:
-                        self.terminal_image.display_image(image_path, width=400)
-                    else:
-                        print(f"Updated board: {image_path}")
-                else:
-                    self.display.show_error("No hints available")
+            command = commands.get(user_input)
+            if command is not None:
+                if command(puzzle):
+                    return
                 continue
 
             # Validate move
-            is_correct, message = self.manager.validate_move(user_input)
+            is_correct, message = manager.validate_move(user_input)
 
             if is_correct:
                 self.display.show_success(message)
 
                 # Re-render board after move (if puzzle continues)
-                if not self.manager.is_puzzle_complete():
-                    current_board = self.manager.get_current_board()
-                    image_path = self.renderer.render_puzzle(
+                if not is_complete():
+                    current_board = get_board()
+                    image_path = render(
                         current_board,
                         puzzle.puzzle_id
                     )
 
                     # Display updated board
-                    if self.can_show_inline:
-                        print()  # Add spacing
-                        self.terminal_image.display_image(image_path, width=400)
-                    else:
-                        turn = "White" if current_board.turn == chess.WHITE else "Black"
-                        print(f"\n{turn} to move")
-                        print(f"Board updated: {image_path}")
+                    show_board(image_path, current_board, update=True)
             else:
                 self.display.show_error(message)
 
@@ -184,6 +207,84 @@ class ChessPuzzleCLI:
 
         self.display.pause()
 
+    def _cmd_quit(self, puzzle: Puzzle) -> bool:
+        """
+        Quit the current puzzle immediately without confirmation
+
+        Args:
+            puzzle: Current puzzle
+
+        Returns:
+            True (the puzzle loop should end)
+        """
+        self.manager.finish_puzzle(quit_early=True)
+        return True
+
+    def _cmd_hint(self, puzzle: Puzzle) -> bool:
+        """
+        Show the next hint and re-render the board with it
+
+        Args:
+            puzzle: Current puzzle
+
+        Returns:
+            False (the puzzle loop continues)
+        """
+        hint = self.manager.get_hint()
+        if not hint:
+            self.display.show_error("No hints available")
+            return False
+
+        self.display.show_hint(hint)
+
+        # Re-render board with hint visualization, unless this exact hint
+        # was already drawn for this position (e.g. repeated level 4)
+        current_board = self.manager.get_current_board()
+        if current_board is None:
+            return False
+        key = (puzzle.puzzle_id, hint.level, current_board.fen())
+        image_path = self._hint_images.get(key)
+        if image_path is None:
+            image_path = self.renderer.render_puzzle(
+                current_board,
+                puzzle.puzzle_id,
+                hint=hint
+            )
+            self._hint_images[key] = image_path
+
+        # Display updated board
+        self._show_board(image_path, current_board, update=True)
+        return False
+
+    def _show_inline(self, image_path: str, board: chess.Board, update: bool = False):
+        """
+        Display board image inline in the terminal
+
+        Args:
+            image_path: Path to board image
+            board: Board shown in the image
+            update: Whether this refreshes an already shown board
+        """
+        if update:
+            print()  # Add spacing
+        self.terminal_image.display_image(image_path, width=400)
+
+    def _show_path(self, image_path: str, board: chess.Board, update: bool = False):
+        """
+        Display board image path for terminals without inline images
+
+        Args:
+            image_path: Path to board image
+            board: Board shown in the image
+            update: Whether this refreshes an already shown board
+        """
+        turn = _TURN_NAME[board.turn]
+        if update:
+            print(_FMT_TO_MOVE(turn))
+            print(_FMT_BOARD_UPDATED(image_path))
+        else:
+            self.display.show_board_info(image_path, turn)
+
     def show_statistics(self):
         """Display user statistics"""
         stats = self.manager.get_statistics()
@@ -2,9 +2,43 @@
 Console display and formatting
 """
 
+import sys
+from typing import Callable
 from data.models import Puzzle, UserProgress, Hint
 from utils.helpers import format_time
 
+# Status glyphs
+_CHECK = "✓"
+_CROSS = "✗"
+_WARN = "⚠"
+_BULB = "💡"
+_PARTY = "🎉"
+_BLOCK = "█"
+
+# Separator lines
+_EQ60 = "=" * 60
+_DASH60 = "-" * 60
+_NL_EQ60 = "\n" + _EQ60
+_NL_DASH60 = "\n" + _DASH60
+
+# Carriage return + ANSI "erase entire line"
+_CLEAR_LINE = "\r\x1b[2K"
+
+# Difficulty histogram bars, indexed by count (capped at 20)
+_BARS = tuple(_BLOCK * i for i in range(21))
+
+
+def _ansi_wrapper(code: str, reset: str) -> Callable[[str], str]:
+    """Build a function that wraps text in an ANSI code and a reset"""
+    def wrap(text: str) -> str:
+        return code + text + reset
+    return wrap
+
+
+def _plain(text: str) -> str:
+    """Return text unchanged (used when colors are disabled)"""
+    return text
+
 
 class Display:
     """Console output formatting"""
@@ -29,30 +63,81 @@ class Display:
         """
         self.use_colors = use_colors
 
-    def _color(self, text: str, color: str) -> str:
-        """Apply color to text if colors enabled"""
-        if not self.use_colors:
-            return text
-        return f"{self.COLORS.get(color, '')}{text}{self.COLORS['reset']}"
+        # One wrapper per color, bound once so drawing needs no dict lookup;
+        # all are identity when colors are off
+        colors = self.COLORS
+        reset = colors['reset']
+        self._bold = _ansi_wrapper(colors['bold'], reset) if use_colors else _plain
+        self._green = _ansi_wrapper(colors['green'], reset) if use_colors else _plain
+        self._red = _ansi_wrapper(colors['red'], reset) if use_colors else _plain
+        self._yellow = _ansi_wrapper(colors['yellow'], reset) if use_colors else _plain
+        self._blue = _ansi_wrapper(colors['blue'], reset) if use_colors else _plain
+        self._cyan = _ansi_wrapper(colors['cyan'], reset) if use_colors else _plain
+
+        # Static screens, rendered once so each show_* is a single write
+        bold = self._bold
+        cyan = self._cyan
+        self._welcome_text = "\n".join([
+            _NL_EQ60,
+            bold("  CHESS PUZZLE TRAINER"),
+            _EQ60,
+            "\nWelcome! Solve chess puzzles and improve your tactical skills.",
+            "Puzzles are sourced from Lichess.org database.\n",
+        ]) + "\n"
+        self._menu_text = "\n".join([
+            _NL_DASH60,
+            bold("MAIN MENU"),
+            _DASH60,
+            f"\n{cyan('1.')} Play Puzzle",
+            f"{cyan('2.')} View Statistics",
+            f"{cyan('3.')} Help",
+            f"{cyan('4.')} Exit",
+            "",
+        ]) + "\n"
+        self._help_text = "\n".join([
+            _NL_EQ60,
+            bold("HELP - HOW TO PLAY"),
+            _EQ60,
+
+            "\n" + bold("Difficulty Levels:"),
+            "  1 = Beginner (600-1200)",
+            "  2 = Intermediate (1200-1600)",
+            "  3 = Advanced (1600-2000)",
+            "  4 = Expert (2000-2400)",
+            "  5 = Master (2400-3000)",
+
+            "\n" + bold("Game Phases:"),
+            "  1 = Opening positions",
+            "  2 = Middlegame positions",
+            "  3 = Endgame positions",
+
+            "\n" + bold("Move Notation:"),
+            "  Standard Algebraic: Nf3, e4, Qxd5, O-O",
+            "  UCI format: g1f3, e2e4, d1d5, e1g1",
+
+            "\n" + bold("Commands During Puzzle:"),
+            "  hint - Get progressive hints (4 levels)",
+            "  quit or ESC - Exit current puzzle",
+
+            "\n" + bold("Timer:"),
+            "  Stopwatch mode automatically tracks your solve time",
+
+            "\n" + bold("Hints:"),
+            "  Level 1: Piece to move",
+            "  Level 2: Source square",
+            "  Level 3: Destination square",
+            "  Level 4: Full move",
+
+            _EQ60,
+        ]) + "\n"
 
     def show_welcome(self):
         """Display welcome message"""
-        print("\n" + "=" * 60)
-        print(self._color("  CHESS PUZZLE TRAINER", 'bold'))
-        print("=" * 60)
-        print("\nWelcome! Solve chess puzzles and improve your tactical skills.")
-        print("Puzzles are sourced from Lichess.org database.\n")
+        sys.stdout.write(self._welcome_text)
 
     def show_main_menu(self):
         """Display main menu"""
-        print("\n" + "-" * 60)
-        print(self._color("MAIN MENU", 'bold'))
-        print("-" * 60)
-        print(f"\n{self._color('1.', 'cyan')} Play Puzzle")
-        print(f"{self._color('2.', 'cyan')} View Statistics")
-        print(f"{self._color('3.', 'cyan')} Help")
-        print(f"{self._color('4.', 'cyan')} Exit")
-        print()
+        sys.stdout.write(self._menu_text)
 
     def show_puzzle_header(self, puzzle: Puzzle, difficulty: int, game_phase: str):
         """
@@ -63,14 +148,14 @@ class Display:
             difficulty: Difficulty level (1-5)
             game_phase: Game phase
         """
-        print("\n" + "=" * 60)
-        print(self._color(f"PUZZLE #{puzzle.puzzle_id}", 'bold'))
-        print("=" * 60)
-        print(f"Difficulty: {self._color(f'Level {difficulty}', 'cyan')} (Rating: {puzzle.rating})")
-        print(f"Phase: {self._color(game_phase.capitalize(), 'cyan')}")
-        print(f"Themes: {self._color(puzzle.themes_str, 'yellow')}")
+        print(_NL_EQ60)
+        print(self._bold(f"PUZZLE #{puzzle.puzzle_id}"))
+        print(_EQ60)
+        print(f"Difficulty: {self._cyan(f'Level {difficulty}')} (Rating: {puzzle.rating})")
+        print(f"Phase: {self._cyan(game_phase.capitalize())}")
+        print(f"Themes: {self._yellow(puzzle.themes_str)}")
         print(f"Popularity: {puzzle.popularity} | Plays: {puzzle.nb_plays}")
-        print("=" * 60)
+        print(_EQ60)
 
     def show_board_info(self, image_path: str, turn: str):
         """
@@ -80,8 +165,8 @@ class Display:
             image_path: Path to board image
             turn: Whose turn (White/Black)
         """
-        print(f"\n{self._color(f'{turn} to move', 'bold')}")
-        print(f"Board image: {self._color(image_path, 'blue')}")
+        print(f"\n{self._bold(f'{turn} to move')}")
+        print(f"Board image: {self._blue(image_path)}")
         print("\nFind the best move!")
 
     def show_move_prompt(self):
@@ -90,19 +175,19 @@ class Display:
 
     def show_success(self, message: str):
         """Display success message"""
-        print(self._color(f"✓ {message}", 'green'))
+        print(self._green(f"{_CHECK} {message}"))
 
     def show_error(self, message: str):
         """Display error message"""
-        print(self._color(f"✗ {message}", 'red'))
+        print(self._red(f"{_CROSS} {message}"))
 
     def show_warning(self, message: str):
         """Display warning message"""
-        print(self._color(f"⚠ {message}", 'yellow'))
+        print(self._yellow(f"{_WARN} {message}"))
 
     def show_info(self, message: str):
         """Display info message"""
-        print(self._color(message, 'cyan'))
+        print(self._cyan(message))
 
     def show_hint(self, hint: Hint):
         """
@@ -111,7 +196,7 @@ class Display:
         Args:
             hint: Hint object
         """
-        print(f"\n{self._color(f'💡 Hint (Level {hint.level}/4):', 'yellow')} {hint.message}")
+        print(f"\n{self._yellow(f'{_BULB} Hint (Level {hint.level}/4):')} {hint.message}")
 
     def show_puzzle_complete(self, puzzle: Puzzle, attempts: int, time_taken: float, hints_used: int):
         """
@@ -123,18 +208,21 @@ class Display:
             time_taken: Time in seconds
             hints_used: Number of hints used
         """
-        print("\n" + "=" * 60)
-        print(self._color("🎉 PUZZLE SOLVED!", 'green'))
-        print("=" * 60)
-        print(f"Attempts: {attempts}")
-        print(f"Time: {format_time(time_taken)}")
-        print(f"Hints used: {hints_used}")
-        print(f"Themes: {puzzle.themes_str}")
+        lines = [
+            _NL_EQ60,
+            self._green(f"{_PARTY} PUZZLE SOLVED!"),
+            _EQ60,
+            f"Attempts: {attempts}",
+            f"Time: {format_time(time_taken)}",
+            f"Hints used: {hints_used}",
+            f"Themes: {puzzle.themes_str}",
+        ]
 
         if puzzle.game_url:
-            print(f"\nView original game: {puzzle.game_url}")
+            lines.append(f"\nView original game: {puzzle.game_url}")
 
-        print("=" * 60)
+        lines.append(_EQ60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def show_statistics(self, stats: UserProgress):
         """
@@ -143,59 +231,29 @@ class Display:
         Args:
             stats: UserProgress object
         """
-        print("\n" + "=" * 60)
-        print(self._color("YOUR STATISTICS", 'bold'))
-        print("=" * 60)
-        print(f"\nTotal Puzzles Solved: {self._color(str(stats.total_solved), 'green')}")
-        print(f"Total Attempts: {stats.total_attempts}")
-        print(f"Success Rate: {self._color(f'{stats.success_rate:.1f}%', 'cyan')}")
-        print(f"Current Streak: {self._color(str(stats.current_streak), 'yellow')}")
-        print(f"Best Streak: {self._color(str(stats.best_streak), 'yellow')}")
+        lines = [
+            _NL_EQ60,
+            self._bold("YOUR STATISTICS"),
+            _EQ60,
+            f"\nTotal Puzzles Solved: {self._green(str(stats.total_solved))}",
+            f"Total Attempts: {stats.total_attempts}",
+            f"Success Rate: {self._cyan(f'{stats.success_rate:.1f}%')}",
+            f"Current Streak: {self._yellow(str(stats.current_streak))}",
+            f"Best Streak: {self._yellow(str(stats.best_streak))}",
+            "\n" + self._bold("Solved by Difficulty:"),
+        ]
 
-        print("\n" + self._color("Solved by Difficulty:", 'bold'))
         for diff in range(1, 6):
             count = stats.solved_by_difficulty.get(diff, 0)
-            bar = "█" * min(count, 20)
-            print(f"  Level {diff}: {bar} {count}")
+            bar = _BARS[count if count < 20 else 20]
+            lines.append(f"  Level {diff}: {bar} {count}")
 
-        print("=" * 60)
+        lines.append(_EQ60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def show_help(self):
         """Display help information"""
-        print("\n" + "=" * 60)
-        print(self._color("HELP - HOW TO PLAY", 'bold'))
-        print("=" * 60)
-
-        print("\n" + self._color("Difficulty Levels:", 'bold'))
-        print("  1 = Beginner (600-1200)")
-        print("  2 = Intermediate (1200-1600)")
-        print("  3 = Advanced (1600-2000)")
-        print("  4 = Expert (2000-2400)")
-        print("  5 = Master (2400-3000)")
-
-        print("\n" + self._color("Game Phases:", 'bold'))
-        print("  1 = Opening positions")
-        print("  2 = Middlegame positions")
-        print("  3 = Endgame positions")
-
-        print("\n" + self._color("Move Notation:", 'bold'))
-        print("  Standard Algebraic: Nf3, e4, Qxd5, O-O")
-        print("  UCI format: g1f3, e2e4, d1d5, e1g1")
-
-        print("\n" + self._color("Commands During Puzzle:", 'bold'))
-        print("  hint - Get progressive hints (4 levels)")
-        print("  quit or ESC - Exit current puzzle")
-
-        print("\n" + self._color("Timer:", 'bold'))
-        print("  Stopwatch mode automatically tracks your solve time")
-
-        print("\n" + self._color("Hints:", 'bold'))
-        print("  Level 1: Piece to move")
-        print("  Level 2: Source square")
-        print("  Level 3: Destination square")
-        print("  Level 4: Full move")
-
-        print("=" * 60)
+        sys.stdout.write(self._help_text)
 
     def show_loading(self, message: str = "Loading..."):
         """Display loading message"""
@@ -203,11 +261,11 @@ class Display:
 
     def show_separator(self):
         """Display separator line"""
-        print("-" * 60)
+        print(_DASH60)
 
     def clear_line(self):
         """Clear current line"""
-        print("\r" + " " * 80 + "\r", end='')
+        sys.stdout.write(_CLEAR_LINE)
 
     def prompt_input(self, message: str) -> str:
         """
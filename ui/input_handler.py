@@ -2,17 +2,118 @@
 User input handling and processing
 """
 
+import sys
+from functools import lru_cache
 from typing import Optional, Tuple
-from utils.validators import InputValidator
+from utils.validators import validate_difficulty, validate_yes_no
 from utils.exceptions import InvalidDifficultyError, InvalidGamePhaseError
 
+# In-puzzle commands (matched case-insensitively), mapped to their canonical
+# literal so callers get an interned string rather than a lowercased copy
+_COMMANDS = {name: name for name in ('hint', 'quit', 'exit', 'help', 'esc')}
+
+# Returned by InputHandler._prompt_int when input was rejected
+_INVALID = object()
+
+# Game phases by menu number (1-3)
+_GAME_PHASES = ('opening', 'middlegame', 'endgame')
+
+# (enabled, time_limit) by timer menu number (1-5)
+_TIMER_MODES = (
+    (False, None),  # No timer
+    (True, None),   # Stopwatch
+    (True, 300),    # 5 minutes
+    (True, 180),    # 3 minutes
+    (True, 60),     # 1 minute
+)
+
+# Color codes
+_CYAN = '\033[96m'
+_YELLOW = '\033[93m'
+_GREEN = '\033[92m'
+_RESET = '\033[0m'
+
+# Static menus, formatted once at import instead of on every prompt
+_DIFFICULTY_MENU = (
+    "\nSelect difficulty level:\n"
+    f"  {_CYAN}1{_RESET} = Beginner {_YELLOW}(600-1200){_RESET}\n"
+    f"  {_CYAN}2{_RESET} = Intermediate {_YELLOW}(1200-1600){_RESET}\n"
+    f"  {_CYAN}3{_RESET} = Advanced {_YELLOW}(1600-2000){_RESET}\n"
+    f"  {_CYAN}4{_RESET} = Expert {_YELLOW}(2000-2400){_RESET}\n"
+    f"  {_CYAN}5{_RESET} = Master {_YELLOW}(2400-3000){_RESET}\n"
+)
+_GAME_PHASE_MENU = (
+    "\nSelect game phase:\n"
+    f"  {_CYAN}1{_RESET} = Opening positions\n"
+    f"  {_CYAN}2{_RESET} = Middlegame positions\n"
+    f"  {_CYAN}3{_RESET} = Endgame positions\n"
+)
+_THEME_MENU_HEADER = (
+    f"\nSelect a theme {_YELLOW}(or press Enter for any theme){_RESET}:\n"
+    f"  {_CYAN}0{_RESET} = Any theme (random)"
+)
+_THEME_MENU_FOOTER = f"\n  {_YELLOW}Or type a specific theme name{_RESET}\n"
+_TIMER_MENU = (
+    "\nTimer mode:\n"
+    "  1 = No timer (practice mode)\n"
+    "  2 = Stopwatch (track time)\n"
+    "  3 = Countdown (5 minutes)\n"
+    "  4 = Countdown (3 minutes)\n"
+    "  5 = Countdown (1 minute)\n"
+)
+
+
+@lru_cache(maxsize=8)
+def _render_theme_menu(themes: Tuple[Tuple[str, int], ...]) -> str:
+    """
+    Build the theme menu, memoized by the themes shown
+
+    Args:
+        themes: (theme_name, count) tuples to list, in menu order
+
+    Returns:
+        Full menu text, ready for a single write
+    """
+    lines = [_THEME_MENU_HEADER]
+    for idx, (theme_name, count) in enumerate(themes, 1):
+        lines.append(f"  {_CYAN}{idx}{_RESET} = {_GREEN}{theme_name}{_RESET} {_YELLOW}({count} puzzles){_RESET}")
+    lines.append(_THEME_MENU_FOOTER)
+    return "\n".join(lines)
+
+
+def _read_line(prompt: str = "") -> str:
+    """
+    input() replacement for non-interactive stdin (pipes, files)
+
+    Reads the next line directly from sys.stdin, skipping input()'s
+    terminal handling. The prompt is still flushed before blocking, so
+    a program driving us over pipes sees it before it answers.
+
+    Args:
+        prompt: Prompt to write before reading
+
+    Returns:
+        Line without its trailing newline
+
+    Raises:
+        EOFError: If stdin is exhausted
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
 
 class InputHandler:
     """Handles user input with validation"""
 
     def __init__(self):
         """Initialize input handler"""
-        self.validator = InputValidator()
+        # Scripted runs read stdin line by line; terminals keep input()
+        stdin = sys.stdin
+        self._read = _read_line if stdin is not None and not stdin.isatty() else input
 
     def get_menu_choice(self, min_choice: int = 1, max_choice: int = 4) -> Optional[int]:
         """
@@ -25,21 +126,8 @@ class InputHandler:
         Returns:
             Choice number or None if invalid
         """
-        try:
-            choice_str = input("Enter your choice: ").strip()
-            choice = int(choice_str)
-
-            if min_choice <= choice <= max_choice:
-                return choice
-            else:
-                print(f"Please enter a number between {min_choice} and {max_choice}")
-                return None
-
-        except ValueError:
-            print("Please enter a valid number")
-            return None
-        except (KeyboardInterrupt, EOFError):
-            return None
+        choice = self._prompt_int("Enter your choice: ", min_choice, max_choice)
+        return None if choice is _INVALID else choice
 
     def get_difficulty(self) -> Optional[int]:
         """
@@ -48,26 +136,16 @@ class InputHandler:
         Returns:
             Difficulty (1-5) or None if cancelled
         """
-        # Color codes
-        CYAN = '\033[96m'
-        YELLOW = '\033[93m'
-        RESET = '\033[0m'
-
-        print("\nSelect difficulty level:")
-        print(f"  {CYAN}1{RESET} = Beginner {YELLOW}(600-1200){RESET}")
-        print(f"  {CYAN}2{RESET} = Intermediate {YELLOW}(1200-1600){RESET}")
-        print(f"  {CYAN}3{RESET} = Advanced {YELLOW}(1600-2000){RESET}")
-        print(f"  {CYAN}4{RESET} = Expert {YELLOW}(2000-2400){RESET}")
-        print(f"  {CYAN}5{RESET} = Master {YELLOW}(2400-3000){RESET}")
+        sys.stdout.write(_DIFFICULTY_MENU)
 
         while True:
             try:
-                difficulty_str = input("\nEnter difficulty (1-5): ").strip()
+                difficulty_str = self._read("\nEnter difficulty (1-5): ").strip()
 
                 if not difficulty_str:
                     return None
 
-                difficulty = self.validator.validate_difficulty(difficulty_str)
+                difficulty = validate_difficulty(difficulty_str)
                 return difficulty
 
             except InvalidDifficultyError as e:
@@ -84,40 +162,12 @@ class InputHandler:
         Returns:
             Game phase ('opening', 'middlegame', 'endgame') or None if cancelled
         """
-        # Color codes
-        CYAN = '\033[96m'
-        RESET = '\033[0m'
-
-        print("\nSelect game phase:")
-        print(f"  {CYAN}1{RESET} = Opening positions")
-        print(f"  {CYAN}2{RESET} = Middlegame positions")
-        print(f"  {CYAN}3{RESET} = Endgame positions")
+        sys.stdout.write(_GAME_PHASE_MENU)
 
         while True:
-            try:
-                choice_str = input("\nGame phase (1-3): ").strip()
-
-                if not choice_str:
-                    return None
-
-                choice = int(choice_str)
-
-                if choice == 1:
-                    return 'opening'
-                elif choice == 2:
-                    return 'middlegame'
-                elif choice == 3:
-                    return 'endgame'
-                else:
-                    print("Please enter a number between 1 and 3")
-                    continue
-
-            except ValueError:
-                print("Please enter a valid number")
-                continue
-            except (KeyboardInterrupt, EOFError):
-                print()
-                return None
+            choice = self._prompt_int("\nGame phase (1-3): ", 1, 3)
+            if choice is not _INVALID:
+                return None if choice is None else _GAME_PHASES[choice - 1]
 
     def get_move_or_command(self) -> Optional[str]:
         """
@@ -127,24 +177,20 @@ class InputHandler:
             Move string, command ('hint', 'quit'), or None if cancelled
         """
         try:
-            import sys
-            import termios
-            import tty
-
-            # Check for ESC key (non-blocking)
-            user_input = input().strip()
+            user_input = self._read().strip()
 
             if not user_input:
                 return None
 
             # Check for ESC character (ASCII 27)
-            if user_input == '\x1b' or user_input == chr(27):
+            if user_input == '\x1b':
                 return 'quit'
 
-            # Only lowercase if it's a command (hint, quit)
+            # Commands are case-insensitive (hint, quit)
             # Keep moves case-sensitive for SAN notation
-            if user_input.lower() in ['hint', 'quit', 'exit', 'help', 'esc']:
-                return user_input.lower()
+            command = _COMMANDS.get(user_input.lower())
+            if command is not None:
+                return command
 
             # Return move as-is (case-sensitive)
             return user_input
@@ -165,8 +211,8 @@ class InputHandler:
         """
         while True:
             try:
-                response = input(f"{prompt} (y/n): ").strip()
-                return self.validator.validate_yes_no(response)
+                response = self._read(f"{prompt} (y/n): ").strip()
+                return validate_yes_no(response)
 
             except ValueError as e:
                 print(str(e))
@@ -187,7 +233,7 @@ class InputHandler:
             User input or None if cancelled
         """
         try:
-            text = input(f"{prompt}: ").strip()
+            text = self._read(f"{prompt}: ").strip()
 
             if not text and not allow_empty:
                 print("Input cannot be empty")
@@ -209,26 +255,13 @@ class InputHandler:
         Returns:
             Theme name or None for any theme, or None if cancelled
         """
-        # Color codes
-        CYAN = '\033[96m'
-        YELLOW = '\033[93m'
-        GREEN = '\033[92m'
-        RESET = '\033[0m'
-
-        print(f"\nSelect a theme {YELLOW}(or press Enter for any theme){RESET}:")
-        print(f"  {CYAN}0{RESET} = Any theme (random)")
-
         # Show top 10 most popular themes
         display_themes = available_themes[:10]
-
-        for idx, (theme_name, count) in enumerate(display_themes, 1):
-            print(f"  {CYAN}{idx}{RESET} = {GREEN}{theme_name}{RESET} {YELLOW}({count} puzzles){RESET}")
-
-        print(f"\n  {YELLOW}Or type a specific theme name{RESET}")
+        sys.stdout.write(_render_theme_menu(tuple(display_themes)))
 
         while True:
             try:
-                choice_str = input("\nTheme choice (0 for any): ").strip()
+                choice_str = self._read("\nTheme choice (0 for any): ").strip()
 
                 # Empty = any theme
                 if not choice_str or choice_str == "0":
@@ -257,39 +290,44 @@ class InputHandler:
         Returns:
             Dict with 'enabled' and 'time_limit' (seconds) or None if cancelled
         """
-        print("\nTimer mode:")
-        print("  1 = No timer (practice mode)")
-        print("  2 = Stopwatch (track time)")
-        print("  3 = Countdown (5 minutes)")
-        print("  4 = Countdown (3 minutes)")
-        print("  5 = Countdown (1 minute)")
+        sys.stdout.write(_TIMER_MENU)
 
         while True:
-            try:
-                choice_str = input("\nTimer mode (1-5): ").strip()
-
-                if not choice_str:
-                    return {'enabled': False, 'time_limit': None}
-
-                choice = int(choice_str)
-
-                if choice == 1:
-                    return {'enabled': False, 'time_limit': None}
-                elif choice == 2:
-                    return {'enabled': True, 'time_limit': None}
-                elif choice == 3:
-                    return {'enabled': True, 'time_limit': 300}  # 5 minutes
-                elif choice == 4:
-                    return {'enabled': True, 'time_limit': 180}  # 3 minutes
-                elif choice == 5:
-                    return {'enabled': True, 'time_limit': 60}   # 1 minute
-                else:
-                    print("Please enter a number between 1 and 5")
-                    continue
-
-            except ValueError:
-                print("Please enter a valid number")
-                continue
-            except (KeyboardInterrupt, EOFError):
-                print()
+            # Empty input means no timer (mode 1)
+            choice = self._prompt_int("\nTimer mode (1-5): ", 1, 5, default=1)
+            if choice is None:
                 return None
+            if choice is not _INVALID:
+                enabled, time_limit = _TIMER_MODES[choice - 1]
+                return {'enabled': enabled, 'time_limit': time_limit}
+
+    def _prompt_int(self, prompt: str, lo: int, hi: int, default: Optional[int] = None):
+        """
+        Prompt once for a number in a range
+
+        Args:
+            prompt: Input prompt
+            lo: Minimum valid number
+            hi: Maximum valid number
+            default: Value returned for empty input
+
+        Returns:
+            The number, default for empty input, None if cancelled, or
+            _INVALID if the input was rejected (the reason is printed)
+        """
+        try:
+            text = self._read(prompt).strip()
+            if not text:
+                return default
+            number = int(text)
+        except ValueError:
+            print("Please enter a valid number")
+            return _INVALID
+        except (KeyboardInterrupt, EOFError):
+            print()
+            return None
+
+        if lo <= number <= hi:
+            return number
+        print(f"Please enter a number between {lo} and {hi}")
+        return _INVALID
@@ -3,9 +3,19 @@ Common utility functions
 """
 
 import os
+import sys
 from pathlib import Path
 from typing import Optional
 
+# ANSI "erase display" + "cursor home"
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Ordinal suffixes indexed by number % 100
+_ORDINAL_SUFFIXES = tuple(
+    'th' if 10 <= i <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(i % 10, 'th')
+    for i in range(100)
+)
+
 
 def ensure_dir(directory: str) -> Path:
     """
@@ -17,9 +27,10 @@ def ensure_dir(directory: str) -> Path:
     Returns:
         Path object
     """
-    path = Path(directory)
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    # Usually the directory already exists; a stat is enough then
+    if not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
+    return Path(directory)
 
 
 def format_time(seconds: float) -> str:
@@ -33,10 +44,11 @@ def format_time(seconds: float) -> str:
         Formatted string (e.g., "1m 30s" or "45s")
     """
     if seconds < 60:
-        return f"{seconds:.1f}s"
+        # Whole seconds skip float formatting
+        return f"{seconds:.1f}s" if seconds % 1 else f"{int(seconds)}s"
 
     minutes = int(seconds // 60)
-    secs = int(seconds % 60)
+    secs = int(seconds - minutes * 60)
     return f"{minutes}m {secs}s"
 
 
@@ -55,12 +67,22 @@ def truncate_string(text: str, max_length: int, suffix: str = "...") -> str:
     if len(text) <= max_length:
         return text
 
-    return text[:max_length - len(suffix)] + suffix
+    # No room for any text: a negative slice would overshoot max_length
+    suffix_len = len(suffix)
+    if max_length <= suffix_len:
+        return suffix[:max(max_length, 0)]
+
+    return text[:max_length - suffix_len] + suffix
 
 
 def clear_screen():
     """Clear console screen (cross-platform)"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        # Legacy Windows consoles may not interpret ANSI sequences
+        os.system('cls')
+    else:
+        sys.stdout.write(_CLEAR_SCREEN)
+        sys.stdout.flush()
 
 
 def get_ordinal_suffix(number: int) -> str:
@@ -73,9 +95,4 @@ def get_ordinal_suffix(number: int) -> str:
     Returns:
         Ordinal suffix
     """
-    if 10 <= number % 100 <= 20:
-        suffix = 'th'
-    else:
-        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(number % 10, 'th')
-
-    return f"{number}{suffix}"
+    return f"{number}{_ORDINAL_SUFFIXES[number % 100]}"
@@ -2,9 +2,8 @@
 Timer utilities for puzzle solving
 """
 
-import time
+from time import monotonic as _now
 from typing import Optional
-from datetime import timedelta
 
 
 class PuzzleTimer:
@@ -13,10 +12,15 @@ class PuzzleTimer:
     Supports both countdown and stopwatch modes
     """
 
+    __slots__ = ('time_limit', 'start_time', 'end_time', 'is_running', 'is_countdown')
+
     def __init__(self, time_limit: Optional[int] = None):
         """
         Initialize timer
 
+        Times come from a monotonic clock, so they are only meaningful
+        relative to each other and are unaffected by wall-clock changes.
+
         Args:
             time_limit: Optional time limit in seconds (countdown mode)
                        If None, runs as stopwatch
@@ -29,7 +33,7 @@ class PuzzleTimer:
 
     def start(self):
         """Start the timer"""
-        self.start_time = time.time()
+        self.start_time = _now()
         self.is_running = True
         self.end_time = None
 
@@ -43,7 +47,7 @@ class PuzzleTimer:
         if not self.is_running:
             return 0.0
 
-        self.end_time = time.time()
+        self.end_time = _now()
         self.is_running = False
         return self.get_elapsed()
 
@@ -57,7 +61,7 @@ class PuzzleTimer:
         if not self.start_time:
             return 0.0
 
-        end = self.end_time if self.end_time else time.time()
+        end = self.end_time if self.end_time else _now()
         return end - self.start_time
 
     def get_remaining(self) -> Optional[float]:
@@ -100,12 +104,8 @@ class PuzzleTimer:
         Returns:
             Formatted time string
         """
-        td = timedelta(seconds=int(seconds))
-        total_seconds = int(td.total_seconds())
-
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        secs = total_seconds % 60
+        hours, rem = divmod(int(seconds), 3600)
+        minutes, secs = divmod(rem, 60)
 
         if hours > 0:
             return f"{hours:02d}:{minutes:02d}:{secs:02d}"
@@ -141,18 +141,16 @@ class PuzzleTimer:
             Status string showing elapsed or remaining time
         """
         if not self.is_running:
-            if self.end_time:
-                return f"Completed in {self.get_formatted_elapsed()}"
-            else:
-                return "Not started"
+            return f"Completed in {self.format_time(self.get_elapsed())}" if self.end_time else "Not started"
 
         if self.is_countdown:
+            # Read the clock once and format that same value
             remaining = self.get_remaining()
             if remaining is not None and remaining <= 0:
                 return "Time's up!"
-            return f"Time remaining: {self.get_formatted_remaining()}"
-        else:
-            return f"Elapsed: {self.get_formatted_elapsed()}"
+            return f"Time remaining: {'' if remaining is None else self.format_time(remaining)}"
+
+        return f"Elapsed: {self.format_time(self.get_elapsed())}"
 
     def reset(self):
         """Reset the timer"""
@@ -166,12 +164,16 @@ class TimerStats:
     Statistics for timed puzzle solving
     """
 
+    __slots__ = ('times', 'fastest_time', 'slowest_time', 'average_time', '_sum', '_count')
+
     def __init__(self):
         """Initialize timer stats"""
         self.times: list[float] = []
         self.fastest_time: Optional[float] = None
         self.slowest_time: Optional[float] = None
         self.average_time: float = 0.0
+        self._sum = 0.0
+        self._count = 0
 
     def add_time(self, time_seconds: float):
         """
@@ -182,10 +184,14 @@ class TimerStats:
         """
         self.times.append(time_seconds)
 
-        # Update stats
-        self.fastest_time = min(self.times)
-        self.slowest_time = max(self.times)
-        self.average_time = sum(self.times) / len(self.times)
+        # Update stats incrementally instead of rescanning all times
+        self._sum += time_seconds
+        self._count += 1
+        if self.fastest_time is None or time_seconds < self.fastest_time:
+            self.fastest_time = time_seconds
+        if self.slowest_time is None or time_seconds > self.slowest_time:
+            self.slowest_time = time_seconds
+        self.average_time = self._sum / self._count
 
     def get_stats_summary(self) -> dict:
         """
@@ -204,11 +210,11 @@ class TimerStats:
             }
 
         return {
-            'count': len(self.times),
+            'count': self._count,
             'fastest': self.fastest_time,
             'slowest': self.slowest_time,
             'average': self.average_time,
-            'total': sum(self.times)
+            'total': self._sum
         }
 
     def format_stats(self) -> str:
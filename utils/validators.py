@@ -2,90 +2,114 @@
 Input validation utilities
 """
 
+from types import MappingProxyType
+
 from utils.exceptions import InvalidDifficultyError, InvalidGamePhaseError
 
+# Difficulty strings that need no parsing
+_FAST_DIFFICULTY = {'1': 1, '2': 2, '3': 3, '4': 4, '5': 5}
+
+# Game phase aliases mapped to canonical names (read-only)
+_PHASE_MAP = MappingProxyType({
+    'opening': 'opening',
+    'early': 'opening',
+    'open': 'opening',
+    'middlegame': 'middlegame',
+    'middle': 'middlegame',
+    'mid': 'middlegame',
+    'endgame': 'endgame',
+    'end': 'endgame',
+    'ending': 'endgame'
+})
+
+# Accepted yes/no answers
+_YES = frozenset({'y', 'yes', 'yeah', 'yep'})
+_NO = frozenset({'n', 'no', 'nope'})
+_YES_NO = MappingProxyType({**dict.fromkeys(_YES, True), **dict.fromkeys(_NO, False)})
+_YES_NO_ERROR = "Please enter 'y' or 'n'"
+
+# Case-folds just the letters that occur in yes/no answers
+_YES_NO_FOLD = str.maketrans("YESAHPNO", "yesahpno")
+
+
+def validate_difficulty(value: str) -> int:
+    """
+    Validate difficulty input
+
+    Args:
+        value: User input string
+
+    Returns:
+        Validated difficulty (1-5)
+
+    Raises:
+        InvalidDifficultyError: If invalid
+    """
+    # Common case: the bare string "1".."5", no stripping or int() parse
+    diff = _FAST_DIFFICULTY.get(value)
+    if diff is not None:
+        return diff
+
+    # Whitespace, ints and anything unusual
+    try:
+        diff = int(value)
+    except ValueError:
+        raise InvalidDifficultyError(f"Invalid difficulty format: '{value}'. Must be a number 1-5")
+    if 1 <= diff <= 5:
+        return diff
+    raise InvalidDifficultyError("Difficulty must be between 1 and 5")
+
+
+def validate_game_phase(value: str) -> str:
+    """
+    Validate and normalize game phase input
+
+    Args:
+        value: User input string
+
+    Returns:
+        Normalized game phase ('opening', 'middlegame', or 'endgame')
+
+    Raises:
+        InvalidGamePhaseError: If invalid
+    """
+    try:
+        # Lowercase only when the stripped input is not already a key
+        normalized = value.strip()
+        return _PHASE_MAP.get(normalized) or _PHASE_MAP[normalized.lower()]
+    except (KeyError, AttributeError):
+        raise InvalidGamePhaseError(
+            f"Invalid game phase: '{value}'. "
+            "Must be 'opening' (or 'early'), 'middlegame' (or 'mid'), or 'endgame' (or 'end')"
+        )
+
+
+def validate_yes_no(value: str) -> bool:
+    """
+    Validate yes/no input
+
+    Args:
+        value: User input string
+
+    Returns:
+        True for yes, False for no
+
+    Raises:
+        ValueError: If invalid
+    """
+    # Case-fold only when the stripped input is not already a key
+    normalized = value.strip()
+    answer = _YES_NO.get(normalized)
+    if answer is None:
+        answer = _YES_NO.get(normalized.translate(_YES_NO_FOLD))
+    if answer is None:
+        raise ValueError(_YES_NO_ERROR)
+    return answer
+
 
 class InputValidator:
-    """Validates user inputs"""
-
-    @staticmethod
-    def validate_difficulty(value: str) -> int:
-        """
-        Validate difficulty input
-
-        Args:
-            value: User input string
-
-        Returns:
-            Validated difficulty (1-5)
-
-        Raises:
-            InvalidDifficultyError: If invalid
-        """
-        try:
-            diff = int(value)
-            if 1 <= diff <= 5:
-                return diff
-            raise InvalidDifficultyError("Difficulty must be between 1 and 5")
-        except ValueError:
-            raise InvalidDifficultyError(f"Invalid difficulty format: '{value}'. Must be a number 1-5")
-
-    @staticmethod
-    def validate_game_phase(value: str) -> str:
-        """
-        Validate and normalize game phase input
-
-        Args:
-            value: User input string
-
-        Returns:
-            Normalized game phase ('opening', 'middlegame', or 'endgame')
-
-        Raises:
-            InvalidGamePhaseError: If invalid
-        """
-        normalized = value.lower().strip()
-
-        # Map aliases to canonical names
-        phase_map = {
-            'opening': 'opening',
-            'early': 'opening',
-            'open': 'opening',
-            'middlegame': 'middlegame',
-            'middle': 'middlegame',
-            'mid': 'middlegame',
-            'endgame': 'endgame',
-            'end': 'endgame',
-            'ending': 'endgame'
-        }
-
-        if normalized in phase_map:
-            return phase_map[normalized]
-        else:
-            raise InvalidGamePhaseError(
-                f"Invalid game phase: '{value}'. "
-                "Must be 'opening' (or 'early'), 'middlegame' (or 'mid'), or 'endgame' (or 'end')"
-            )
-
-    @staticmethod
-    def validate_yes_no(value: str) -> bool:
-        """
-        Validate yes/no input
-
-        Args:
-            value: User input string
-
-        Returns:
-            True for yes, False for no
-
-        Raises:
-            ValueError: If invalid
-        """
-        normalized = value.lower().strip()
-
-        if normalized in ['y', 'yes', 'yeah', 'yep']:
-            return True
-        elif normalized in ['n', 'no', 'nope']:
-            return False
-        else:
-            raise ValueError(f"Please enter 'y' or 'n'")
+    """Validates user inputs (wraps the module-level validators)"""
+
+    validate_difficulty = staticmethod(validate_difficulty)
+    validate_game_phase = staticmethod(validate_game_phase)
+    validate_yes_no = staticmethod(validate_yes_no)